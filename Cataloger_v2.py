@@ -1,7 +1,6 @@
 import streamlit as st
-import requests
-import pandas as pd
-import gender_guesser.detector as gender
+import resources
+from author_profile import predict_sex
 
 # --- CONFIGURATION ---
 st.set_page_config(page_title="Research Cataloger Pro", page_icon="🗂️", layout="wide")
@@ -25,20 +24,6 @@ with st.sidebar:
     limit = st.slider("Max Results", 10, 200, 50)
     st.caption("Note: 'Sex' is predicted using the *gender-guesser* library based on first names.")
 
-# --- HELPER: Gender Predictor ---
-d = gender.Detector()
-
-def predict_sex(name):
-    if not name: return "Unknown"
-    # Get first name only
-    first_name = name.split()[0]
-    guess = d.get_gender(first_name)
-    
-    # Simplify output
-    if "female" in guess: return "Female"
-    if "male" in guess: return "Male"
-    return "Unknown/Unisex"
-
 # --- MAIN APP ---
 if st.button("🚀 Fetch Catalog"):
     
@@ -57,7 +42,7 @@ if st.button("🚀 Fetch Catalog"):
     }
     
     try:
-        r = requests.get(url, params=params)
+        r = resources.http_get(url, params=params)
         
         if r.status_code != 200:
             st.error(f"API Error: {r.status_code}")
@@ -121,7 +106,7 @@ if st.button("🚀 Fetch Catalog"):
             progress.progress((i + 1) / len(results))
             
         # --- DISPLAY RESULTS ---
-        df = pd.DataFrame(catalog)
+        df = resources.pandas.DataFrame(catalog)
         
         # Metrics
         c1, c2, c3 = st.columns(3)
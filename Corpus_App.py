@@ -1,10 +1,14 @@
 import streamlit as st
-import requests
 import pandas as pd
 import io
-import fitz  # PyMuPDF
 from duckduckgo_search import DDGS
 import time
+import uuid
+import resources
+import job_runner
+from token_stats import TokenStats
+from pdf_probe import probe_fitz
+from collections import Counter
 
 # --- CONFIG ---
 st.set_page_config(page_title="Wild Web Corpus Builder", page_icon="🕸️", layout="wide")
@@ -20,32 +24,34 @@ with st.sidebar:
 
 # --- FUNCTIONS ---
 def get_pdf_text(url):
-    """Downloads and reads a PDF from a direct URL."""
+    """Downloads a PDF from a direct URL and reads it if the probe says it's worth it.
+    Returns (text, reason) - text is None when the document was skipped."""
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = resources.http_get(url, headers=headers, timeout=10)
         
-        if response.status_code == 200 and 'application/pdf' in response.headers.get('Content-Type', '').lower():
-            with fitz.open(stream=response.content, filetype="pdf") as doc:
-                text = ""
-                for page in doc:
-                    text += page.get_text()
-            return text
-        return None
+        if response.status_code != 200:
+            return None, f"http_{response.status_code}"
+        if 'application/pdf' not in response.headers.get('Content-Type', '').lower():
+            return None, "not_pdf"
+        
+        with resources.fitz.open(stream=response.content, filetype="pdf") as doc:
+            # Cheap look at a few pages before paying for full extraction
+            probe = probe_fitz(doc)
+            if not probe['ok']:
+                return None, probe['reason']
+            text = ""
+            for page in doc:
+                text += page.get_text()
+        return text, "ok"
     except:
-        return None
+        return None, "unreadable"
 
-# --- MAIN APP ---
-if st.button("🚀 Start Hunter"):
-    
-    # UI Setup
-    pbar = st.progress(0)
-    log = st.empty()
-    metric = st.empty()
-    
+def hunt(job, topic, target_words, max_results):
+    """The hunter loop. Runs on the job_runner pool, so it must not touch st.*"""
     # Search Query: Force PDF filetype
     query = f'{topic} filetype:pdf'
-    log.info(f"🔎 Searching DuckDuckGo for: `{query}`...")
+    job.update(message=f"🔎 Searching DuckDuckGo for: `{query}`...")
     
     # 1. Get Links
     pdf_links = []
@@ -54,46 +60,113 @@ if st.button("🚀 Start Hunter"):
         for r in results:
             pdf_links.append({"title": r['title'], "url": r['href']})
             
-    log.success(f"✅ Found {len(pdf_links)} PDF links. Starting download...")
+    job.update(message=f"✅ Found {len(pdf_links)} PDF links. Starting download...")
     
     # 2. Download & Extract
-    corpus = []
     total_words = 0
+    stats = TokenStats()
+    rejected = Counter()  # Why documents were skipped
     
     for i, link in enumerate(pdf_links):
         if total_words >= target_words:
             break
+        job.check_cancelled()
             
         title = link['title']
         url = link['url']
         
-        log.write(f"⬇️ ({i+1}/{len(pdf_links)}) Downloading: **{title[:40]}...**")
+        job.update(message=f"⬇️ ({i+1}/{len(pdf_links)}) Downloading: **{title[:40]}...**")
         
-        text = get_pdf_text(url)
+        text, reason = get_pdf_text(url)
         
         if text and len(text) > 1000:
-            words = len(text.split())
+            words = stats.add_text(text)
             total_words += words
             
-            corpus.append({
+            job.add_result({
                 "Title": title,
                 "Word_Count": words,
                 "URL": url,
                 "Text_Body": text
             })
             
-            # Update UI
-            metric.metric("Total Words", f"{total_words:,}", f"+{words}")
-            pbar.progress(min(total_words / target_words, 1.0))
+            # Report progress back to the UI
+            job.update(progress=total_words / target_words, total_words=total_words, last_words=words, token_stats=stats)
         
         else:
-            print(f"Skipped {url}")
-            
+            if text is not None:
+                reason = "too_short"
+            rejected[reason] += 1
+            job.update(rejected=dict(rejected))
+            print(f"Skipped ({reason}) {url}")
+
+# --- MAIN APP ---
+# Jobs are tagged with a per-browser owner id kept in the URL, so a reload
+# reattaches to your own harvests and other visitors don't see them.
+if "owner" not in st.query_params:
+    st.query_params["owner"] = uuid.uuid4().hex
+owner = st.query_params["owner"]
+
+if st.button("🚀 Start Hunter"):
+    job = job_runner.submit(topic, hunt, topic, target_words, max_results, owner=owner)
+    st.query_params["job"] = job.id  # Survives a browser refresh
+
+# --- JOB MONITOR ---
+jobs = {j.id: j for j in job_runner.list_jobs(owner)}
+
+if jobs:
+    st.subheader("📋 Harvest Jobs")
+    job_ids = list(jobs)
+    current = st.query_params.get("job")
+    index = job_ids.index(current) if current in job_ids else 0
+    job_id = st.selectbox(
+        "Attach to job",
+        job_ids,
+        index=index,
+        format_func=lambda jid: f"{jobs[jid].name} ({jobs[jid].status}) · {jid}"
+    )
+    st.query_params["job"] = job_id
+    job = jobs[job_id]
+    info = job.snapshot()
+    finished = info['status'] in job_runner.FINISHED_STATES  # One read, so every branch agrees
+    
+    total_words = info['stats'].get('total_words', 0)
+    st.progress(info['progress'])
+    st.metric("Total Words", f"{total_words:,}", f"+{info['stats'].get('last_words', 0)}")
+    st.write(info['message'])
+    if info['stats'].get('rejected'):
+        st.caption("Skipped: " + ", ".join(f"{r} × {n}" for r, n in info['stats']['rejected'].items()))
+    
+    if not finished:
+        if st.button("🛑 Cancel Job", disabled=job.cancel_requested):
+            job.cancel()
+    elif st.button("🗑️ Remove Job"):
+        job_runner.forget(job_id)
+        del st.query_params["job"]
+        st.rerun()
+    
     # 3. Finish
+    if info['status'] == "failed":
+        st.error(f"Error: {info['error']}")
+    
+    if not finished:
+        # Cheap view while running: only the latest documents, no CSV encoding
+        if info['results']:
+            st.info(f"⏳ Partial results: {total_words:,} words from {info['results']} documents so far.")
+            latest = pd.DataFrame(job.latest_results())
+            st.dataframe(latest[['Title', 'Word_Count', 'URL']])
+        
+        # Poll the worker until the job is over
+        time.sleep(1)
+        st.rerun()
+    
+    corpus = job.results()
     if corpus:
-        st.balloons()
         df = pd.DataFrame(corpus)
-        st.success(f"🎉 Mission Complete! Collected {total_words:,} words from {len(df)} documents.")
+        if info['status'] == "done":
+            st.success(f"🎉 Mission Complete! Collected {total_words:,} words from {len(df)} documents.")
+        else:
+            st.info(f"Stopped early: {total_words:,} words from {len(df)} documents.")
         
         # Download
         csv = df.to_csv(index=False).encode('utf-8')
@@ -101,5 +174,14 @@ if st.button("🚀 Start Hunter"):
         
         # Preview
         st.dataframe(df[['Title', 'Word_Count', 'URL']].head())
-    else:
-        st.error("❌ Could not download enough text. Try a different topic.")
\ No newline at end of file
+        
+        # Corpus statistics (counted once during the harvest)
+        stats = info['stats'].get('token_stats')
+        if stats:
+            st.subheader("📊 Corpus Statistics")
+            st.json(stats.summary())
+            c1, c2 = st.columns(2)
+            c1.dataframe(pd.DataFrame(stats.top_words(25), columns=["Word", "Frequency"]))
+            c2.dataframe(pd.DataFrame(stats.top_ngrams(2, 25), columns=["Bigram", "Frequency"]))
+    elif info['status'] == "done":
+        st.error("❌ Could not download enough text. Try a different topic.")
@@ -1,10 +1,9 @@
 import streamlit as st
-import pandas as pd
-import fitz  # PyMuPDF
-from docx import Document
+from docx_stream import get_text_from_docx  # Streams word/document.xml, keeps tables
 import re
 import io
 import zipfile
+import resources  # Lazy fitz/pandas, loaded on the first Scrub & Process
 
 # --- CONFIGURATION ---
 st.set_page_config(page_title="Corpus Scrubber", page_icon="🧽", layout="wide")
@@ -16,10 +15,21 @@ and prepare it for corpus linguistics or machine learning.
 """)
 
 # --- 1. CLEANING FUNCTIONS ---
+# Cleaning patterns (re keeps compiled patterns cached, so reruns of this script reuse them)
+REFERENCES_RE = re.compile(r'(?i)(\n|\r)\s*(references|bibliography|works cited)\s*(\n|\r).*', re.DOTALL)
+URL_RE = re.compile(r'http\S+|www\.\S+')
+EMAIL_RE = re.compile(r'\S+@\S+')
+HYPHEN_RE = re.compile(r'(\w+)-\s+(\w+)')
+AUTHOR_YEAR_RE = re.compile(r'\([A-Za-z\s\.,]+,?\s?\d{4}\)')
+NUMERIC_CITE_RE = re.compile(r'\[\d+([–-]\d+)?\]')
+NUMBER_RE = re.compile(r'\d+')
+PUNCT_RE = re.compile(r'[^\w\s]')
+SPACES_RE = re.compile(r'\s+')
+
 def get_text_from_pdf(file_bytes):
     """Fast extraction using PyMuPDF"""
     try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
+        doc = resources.fitz.open(stream=file_bytes, filetype="pdf")
         text = ""
         for page in doc:
             text += page.get_text()
@@ -27,15 +37,6 @@ def get_text_from_pdf(file_bytes):
     except Exception as e:
         return ""
 
-def get_text_from_docx(file_bytes):
-    """Extraction using python-docx"""
-    try:
-        doc = Document(io.BytesIO(file_bytes))
-        full_text = [para.text for para in doc.paragraphs]
-        return '\n'.join(full_text)
-    except Exception as e:
-        return ""
-
 def clean_text_logic(text, config):
     """The Master Cleaning Function"""
     if not text: return ""
@@ -44,34 +45,34 @@ def clean_text_logic(text, config):
     # 1. References Section
     if config['remove_refs']:
         # Cuts text after "References" if it appears on a new line
-        text = re.sub(r'(?i)(\n|\r)\s*(references|bibliography|works cited)\s*(\n|\r).*', '', text, flags=re.DOTALL)
+        text = REFERENCES_RE.sub('', text)
     
     # 2. URLs & Emails
     if config['remove_urls']:
-        text = re.sub(r'http\S+|www\.\S+', '', text)
-        text = re.sub(r'\S+@\S+', '', text)
+        text = URL_RE.sub('', text)
+        text = EMAIL_RE.sub('', text)
 
     # 3. PDF Artifacts (Hyphenation)
     if config['fix_hyphens']:
         # "respon- sibility" -> "responsibility"
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
+        text = HYPHEN_RE.sub(r'\1\2', text)
 
     # B. Noise Removal (The "Scrubbing")
     # 4. Citations (Academic specific)
     if config['remove_citations']:
         # Remove (Smith, 2020) or (Smith et al., 2020)
-        text = re.sub(r'\([A-Za-z\s\.,]+,?\s?\d{4}\)', '', text)
+        text = AUTHOR_YEAR_RE.sub('', text)
         # Remove [1], [12], [1-5]
-        text = re.sub(r'\[\d+([–-]\d+)?\]', '', text)
+        text = NUMERIC_CITE_RE.sub('', text)
 
     # 5. Numbers
     if config['remove_numbers']:
-        text = re.sub(r'\d+', '', text)
+        text = NUMBER_RE.sub('', text)
 
     # 6. Punctuation
     if config['remove_punct']:
         # Replace punctuation with space to prevent word merging
-        text = re.sub(r'[^\w\s]', ' ', text)
+        text = PUNCT_RE.sub(' ', text)
 
     # 7. Lowercase
     if config['lowercase']:
@@ -79,7 +80,7 @@ def clean_text_logic(text, config):
 
     # C. Final Polish
     # Collapse multiple spaces into one
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = SPACES_RE.sub(' ', text).strip()
     
     return text
 
@@ -156,7 +157,7 @@ if uploaded_files:
         # --- DOWNLOAD LOGIC ---
         if output_format == "CSV (Spreadsheet)":
             # OPTION A: CSV
-            df = pd.DataFrame(cleaned_corpus)
+            df = resources.pandas.DataFrame(cleaned_corpus)
             st.dataframe(df.head())
             
             csv = df.to_csv(index=False).encode('utf-8')
@@ -0,0 +1,68 @@
+import streamlit as st
+import resources
+import time
+from author_profile import predict_sex
+from federated_catalog import federated_search, SOURCES
+
+# --- CONFIGURATION ---
+st.set_page_config(page_title="Federated Cataloger", page_icon="🔗", layout="wide")
+st.title("🔗 Federated Research Cataloger")
+st.markdown("""
+**Semantic Scholar + OpenAlex in one pass.**
+Both APIs are queried at the same time and merged on **DOI** (falling back to the title),
+so you get one deduplicated bibliography with a **Sources** column showing where each paper came from.
+""")
+
+# --- SIDEBAR ---
+with st.sidebar:
+    st.header("⚙️ Search Parameters")
+    query = st.text_input("Topic", value="Social Science Philippines")
+    year_range = st.slider("Publication Years", 1990, 2025, (2020, 2024))
+    limit = st.slider("Max Results per Source", 10, 500, 100)
+    sources = st.multiselect("Sources", list(SOURCES), default=list(SOURCES))
+    st.caption("Note: 'Sex' is predicted using the *gender-guesser* library based on first names.")
+
+# --- MAIN APP ---
+if st.button("🚀 Fetch Federated Catalog"):
+    
+    status = st.empty()
+    status.write(f"🔎 Querying {', '.join(sources)} concurrently...")
+    counters = st.empty()
+    
+    def on_record(source, row, counts):
+        counters.write(" · ".join(f"**{s}**: {n}" for s, n in counts.items()))
+    
+    start = time.time()
+    try:
+        catalog, counts, errors = federated_search(query, year_range[0], year_range[1], limit, sources, on_record)
+    except Exception as e:
+        st.error(f"Critical Error: {e}")
+        st.stop()
+    
+    for source, error in errors.items():
+        st.warning(f"⚠️ {source} failed: {error}")
+    
+    if not catalog:
+        st.warning("No results found. Try broadening your search or year range.")
+        st.stop()
+    
+    df = resources.pandas.DataFrame(catalog)
+    df.insert(df.columns.get_loc("First_Author") + 1, "Author_Sex_Pred", df["First_Author"].map(predict_sex))
+    status.success(f"✅ Merged {sum(counts.values())} records into {len(df)} unique papers in {time.time() - start:.1f}s")
+    
+    # Metrics
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Unique Papers", len(df))
+    c2.metric("Found in Both", int(df['Sources'].str.contains(r'\+').sum()))
+    c3.metric("With DOI", int(df['DOI'].notna().sum()))
+    
+    st.dataframe(df, use_container_width=True)
+    
+    # Download
+    csv = df.to_csv(index=False).encode('utf-8')
+    st.download_button(
+        "📥 Download Federated Catalog (CSV)",
+        csv,
+        "federated_catalog.csv",
+        "text/csv"
+    )
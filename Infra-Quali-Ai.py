@@ -1,10 +1,9 @@
 import streamlit as st
-import google.generativeai as genai
 import os
 from dotenv import load_dotenv
-import PyPDF2
-import pandas as pd
 import io
+import resources
+from quote_grounding import ground_quotes
 
 # --- 1. SETUP & AUTH ---
 load_dotenv("sec.env")
@@ -18,8 +17,7 @@ if not api_key:
     st.stop()
 
 # Clean key just in case (removes spaces/brackets)
-api_key = api_key.strip().replace("[", "").replace("]", "")
-genai.configure(api_key=api_key)
+api_key = api_key.strip().replace("[", "").replace("]", "")  # genai is configured lazily by resources
 
 # --- 2. SIDEBAR ---
 with st.sidebar:
@@ -31,11 +29,7 @@ with st.sidebar:
     st.title("⚙️ Research Controls")
     
     # AUTOMATIC MODEL LOADER
-    try:
-        with open("latest-model.txt", "r") as f:
-            auto_model = f.read().strip()
-    except:
-        auto_model = "gemini-2.5-flash" # Fallback
+    auto_model = resources.model_name()  # Cached; falls back to gemini-2.5-flash
         
     st.success(f"🤖 Connected to: {auto_model}")
     model_choice = auto_model
@@ -52,7 +46,7 @@ with st.sidebar:
 # --- 3. HELPER FUNCTIONS ---
 def extract_text(uploaded_file):
     try:
-        reader = PyPDF2.PdfReader(uploaded_file)
+        reader = resources.PyPDF2.PdfReader(uploaded_file)
         text = ""
         for page in reader.pages:
             text += page.extract_text()
@@ -64,8 +58,8 @@ def analyze_data(text, codebook, model_name):
     # DEBUG: Print what we are sending
     print(f"Calling model: {model_name}...")
     
-    # CRITICAL FIX: Ensure parentheses () are used, NOT brackets []
-    model = genai.GenerativeModel(model_name) 
+    # Reuse the client across reruns instead of rebuilding it per call
+    model = resources.gemini_model(model_name, api_key)
     
     prompt = f"""
     Act as a Data Analyst.
@@ -100,7 +94,26 @@ if uploaded_file:
                     clean_csv = result.replace("```csv", "").replace("```", "").strip()
                     
                     # Show Data
-                    df = pd.read_csv(io.StringIO(clean_csv), sep="|")
+                    df = resources.pandas.read_csv(io.StringIO(clean_csv), sep="|")
+                    df.columns = df.columns.str.strip()
+                    
+                    # Verify every quote against the PDF text (one pass for all quotes)
+                    if "Quote" in df.columns:
+                        grounding = ground_quotes(text, df["Quote"].tolist())
+                        df["Quote_Status"] = [g["status"] for g in grounding]
+                        df["Quote_Found"] = [g["found"] for g in grounding]
+                        df["Quote_Start"] = resources.pandas.array([g["start"] for g in grounding], dtype="Int64")
+                        df["Quote_End"] = resources.pandas.array([g["end"] for g in grounding], dtype="Int64")
+                        
+                        missing = int((df["Quote_Status"] == "not_found").sum())
+                        unverifiable = int((df["Quote_Status"] == "unverifiable").sum())
+                        if missing:
+                            st.warning(f"⚠️ {missing} of {len(df)} quotes could not be found in the PDF text. Check them before citing.")
+                        if unverifiable:
+                            st.warning(f"⚠️ {unverifiable} of {len(df)} quotes are too short (or have too-short parts around '...') to verify.")
+                        if not missing and not unverifiable:
+                            st.success(f"✅ All {len(df)} quotes verified against the PDF text.")
+                    
                     st.dataframe(df)
                     
                 except Exception as e:
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
-import pandas as pd
 import time
+import resources
+from author_profile import infer_country
 
 # --- CONFIGURATION ---
 st.set_page_config(page_title="Research Cataloger", page_icon="🗂️", layout="wide")
@@ -19,25 +19,6 @@ with st.sidebar:
     limit = st.slider("Number of Papers", 10, 500, 100)
     st.info("Note: 'Country' is inferred from the author's university affiliation.")
 
-# --- HELPER: Country Guesser ---
-def infer_country(affiliation_name):
-    """Simple heuristic to guess country from university name."""
-    if not affiliation_name:
-        return "Unknown"
-    
-    aff = affiliation_name.lower()
-    if "philippines" in aff or "manila" in aff or "diliman" in aff or "lasalle" in aff or "ateneo" in aff:
-        return "Philippines"
-    if "usa" in aff or "united states" in aff or "california" in aff or "harvard" in aff:
-        return "USA"
-    if "uk" in aff or "london" in aff or "oxford" in aff:
-        return "UK"
-    if "singapore" in aff or "nus" in aff:
-        return "Singapore"
-    if "australia" in aff:
-        return "Australia"
-    return "International"
-
 # --- MAIN APP ---
 if st.button("🚀 Build Catalog"):
     
@@ -58,7 +39,7 @@ if st.button("🚀 Build Catalog"):
     }
     
     try:
-        r = requests.get(url, params=params).json()
+        r = resources.http_get(url, params=params).json()
         
         if "data" not in r:
             st.error("❌ No results found. Try a different topic.")
@@ -113,7 +94,7 @@ if st.button("🚀 Build Catalog"):
             progress.progress((i + 1) / len(papers))
             
         # --- OUTPUT ---
-        df = pd.DataFrame(catalog)
+        df = resources.pandas.DataFrame(catalog)
         
         st.success(f"🎉 Catalog Complete! Found {len(df)} papers.")
         
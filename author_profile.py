@@ -0,0 +1,49 @@
+import resources
+
+# --- CONFIGURATION ---
+# infer_country() names -> the ISO codes OpenAlex uses
+COUNTRY_CODES = {
+    "Philippines": "PH",
+    "USA": "US",
+    "UK": "GB",
+    "Singapore": "SG",
+    "Australia": "AU",
+}
+
+
+# --- HELPER: Country Guesser ---
+def infer_country(affiliation_name):
+    """Simple heuristic to guess country from university name."""
+    if not affiliation_name:
+        return "Unknown"
+    
+    aff = affiliation_name.lower()
+    if "philippines" in aff or "manila" in aff or "diliman" in aff or "lasalle" in aff or "ateneo" in aff:
+        return "Philippines"
+    if "usa" in aff or "united states" in aff or "california" in aff or "harvard" in aff:
+        return "USA"
+    if "uk" in aff or "london" in aff or "oxford" in aff:
+        return "UK"
+    if "singapore" in aff or "nus" in aff:
+        return "Singapore"
+    if "australia" in aff:
+        return "Australia"
+    return "International"
+
+
+def infer_country_code(affiliation_name):
+    """infer_country() as an ISO code, or None when it can't tell."""
+    return COUNTRY_CODES.get(infer_country(affiliation_name))
+
+
+# --- HELPER: Gender Predictor ---
+def predict_sex(name):
+    if not name: return "Unknown"
+    # Get first name only
+    first_name = name.split()[0]
+    guess = resources.gender_detector().get_gender(first_name)
+    
+    # Simplify output
+    if "female" in guess: return "Female"
+    if "male" in guess: return "Male"
+    return "Unknown/Unisex"
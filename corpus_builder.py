@@ -1,38 +1,55 @@
-import requests
 import pandas as pd
 import io
 import PyPDF2
 from tqdm import tqdm
 import time
+import resources
+from corpus_index import CorpusIndex
+from token_stats import TokenStats
+from pdf_probe import probe_pypdf
 
 # --- CONFIGURATION ---
 TARGET_WORDS = 1000000  # 1 Million Words
 SEARCH_QUERY = "Social Science Philippines"
 START_YEAR = 2020
 BATCH_SIZE = 100  # How many papers to ask API for at once
+INDEX_DIR = "million_word_index"  # Positional index for fast KWIC lookups
+STATS_FILE = "million_word_stats.json"  # Frequency & n-gram counts
+REJECTS_FILE = "million_word_rejections.csv"  # Skipped PDFs and why
 
-def get_text_from_pdf_url(url):
-    """Downloads a PDF from a URL and extracts text."""
+def get_text_from_pdf_url(url, keep_going=None):
+    """Downloads a PDF from a URL and extracts text if the probe says it's worth it.
+    `keep_going()` is called once the probe passes; extraction is skipped if it returns False.
+    Returns (text, reason) - text is None when the document was skipped."""
     try:
         # Fake a browser header so servers don't block us
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = resources.http_get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             f = io.BytesIO(response.content)
             reader = PyPDF2.PdfReader(f)
+            # Sample a few pages first; skip scans & slide decks early
+            probe = probe_pypdf(reader)
+            if not probe['ok']:
+                return None, probe['reason']
+            if keep_going and not keep_going():
+                return None, "cancelled"
             text = ""
             for page in reader.pages:
                 text += page.extract_text()
-            return text
-        return None
+            return text, "ok"
+        return None, f"http_{response.status_code}"
     except:
-        return None
+        return None, "unreadable"
 
 def build_million_word_corpus():
     total_words_collected = 0
     corpus_data = []
+    rejected = []
     offset = 0
+    index = CorpusIndex()  # Fresh each run, like the CSV and stats it sits next to
+    stats = TokenStats()
     
     # Progress bar setup
     pbar = tqdm(total=TARGET_WORDS, desc="Harvesting Words", unit="word")
@@ -53,7 +70,7 @@ def build_million_word_corpus():
         }
         
         try:
-            r = requests.get(url, params=params).json()
+            r = resources.http_get(url, params=params).json()
             if "data" not in r:
                 print("❌ No more papers found.")
                 break
@@ -68,10 +85,10 @@ def build_million_word_corpus():
                     pdf_url = pdf_info.get('url')
                     
                     # Try to get Full Text
-                    full_text = get_text_from_pdf_url(pdf_url)
+                    full_text, reason = get_text_from_pdf_url(pdf_url)
                     
                     if full_text and len(full_text) > 1000:
-                        word_count = len(full_text.split())
+                        word_count = stats.add_text(full_text)
                         
                         # Add to Dataset
                         corpus_data.append({
@@ -82,12 +99,18 @@ def build_million_word_corpus():
                             "source_url": pdf_url
                         })
                         
+                        index.add_document(full_text, title=paper.get('title'), key=pdf_url)
+                        
                         # Update Counts
                         total_words_collected += word_count
                         pbar.update(word_count)
                         
                         if total_words_collected >= TARGET_WORDS:
                             break
+                    else:
+                        if full_text is not None:
+                            reason = "too_short"
+                        rejected.append({"title": paper.get('title'), "source_url": pdf_url, "reason": reason})
             
             # Move to next page of results
             offset += BATCH_SIZE
@@ -99,6 +122,12 @@ def build_million_word_corpus():
 
     pbar.close()
     
+    # Record what we skipped so the probe thresholds can be tuned
+    if rejected:
+        rejects_df = pd.DataFrame(rejected)
+        rejects_df.to_csv(REJECTS_FILE, index=False)
+        print(f"🚫 Skipped {len(rejects_df)} PDFs: {rejects_df['reason'].value_counts().to_dict()} (see {REJECTS_FILE})")
+    
     # 3. Save to CSV
     if corpus_data:
         df = pd.DataFrame(corpus_data)
@@ -106,6 +135,10 @@ def build_million_word_corpus():
         df.to_csv(filename, index=False)
         print(f"\n✅ DONE! Collected {total_words_collected} words from {len(df)} papers.")
         print(f"💾 Saved to {filename}")
+        index.save(INDEX_DIR)
+        stats.save(STATS_FILE)
+        print(f"📊 Stats saved to {STATS_FILE}: {stats.summary()}")
+        print(f"🗂️ Index saved to {INDEX_DIR} (query with: python corpus_index.py kwic {INDEX_DIR} \"word\")")
     else:
         print("❌ Failed to collect data.")
 
@@ -0,0 +1,216 @@
+import csv
+import json
+import os
+import re
+import sys
+from array import array
+
+# --- CONFIGURATION ---
+TOKEN_RE = re.compile(r"\w+(?:['’-]\w+)*")
+TEXT_COLUMNS = ("text", "Text_Body")  # corpus_builder & Corpus_Scrubber / Corpus_App
+TITLE_COLUMNS = ("title", "Title", "filename")
+KEY_COLUMNS = ("source_url", "URL", "filename", "title", "Title")
+
+csv.field_size_limit(sys.maxsize)  # Full-text cells are far bigger than the default
+
+
+class CorpusIndex:
+    """Positional inverted index with array-backed postings.
+
+    Every document is kept as a stream of surface-token ids (case preserved, for
+    KWIC display). Postings map each lowercased term to a flat array of
+    (doc_id, position) pairs, so keyword lookups are a dict hit and phrase
+    queries only walk the postings of the first word.
+    """
+
+    def __init__(self):
+        self.docs = []          # [{"key", "title", "start", "length"}]
+        self.keys = set()       # Document keys already indexed
+        self.surfaces = []      # surface id -> surface form
+        self.surface_ids = {}   # surface form -> surface id
+        self.surface_term = array('I')  # surface id -> term id
+        self.terms = []         # term id -> lowercased term
+        self.term_ids = {}      # lowercased term -> term id
+        self.postings = []      # term id -> array('I') of doc_id, position pairs
+        self.tokens = array('I')  # All documents' surface ids, back to back
+
+    # --- 1. INGEST ---
+    def _surface_id(self, word):
+        sid = self.surface_ids.get(word)
+        if sid is None:
+            term = word.lower()
+            tid = self.term_ids.get(term)
+            if tid is None:
+                tid = len(self.terms)
+                self.term_ids[term] = tid
+                self.terms.append(term)
+                self.postings.append(array('I'))
+            sid = len(self.surfaces)
+            self.surface_ids[word] = sid
+            self.surfaces.append(word)
+            self.surface_term.append(tid)
+        return sid
+
+    def add_document(self, text, title="", key=None):
+        """Index one document. Returns False if its key was already indexed."""
+        key = key or title
+        if key and key in self.keys:
+            return False
+
+        doc_id = len(self.docs)
+        start = len(self.tokens)
+        for pos, match in enumerate(TOKEN_RE.finditer(text or "")):
+            sid = self._surface_id(match.group())
+            self.tokens.append(sid)
+            postings = self.postings[self.surface_term[sid]]
+            postings.append(doc_id)
+            postings.append(pos)
+
+        self.docs.append({"key": key, "title": title, "start": start, "length": len(self.tokens) - start})
+        if key:
+            self.keys.add(key)
+        return True
+
+    def add_csv(self, path):
+        """Index every new row of a harvester/scrubber CSV. Returns rows added."""
+        added = 0
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                text = next((row[c] for c in TEXT_COLUMNS if c in row), "")
+                title = next((row[c] for c in TITLE_COLUMNS if c in row), "")
+                key = next((row[c] for c in KEY_COLUMNS if row.get(c)), None)
+                if self.add_document(text, title=title, key=key):
+                    added += 1
+        return added
+
+    # --- 2. QUERIES ---
+    def _phrase_hits(self, phrase):
+        words = [w.lower() for w in TOKEN_RE.findall(phrase)]
+        if not words:
+            return []
+        tids = [self.term_ids.get(w) for w in words]
+        if None in tids:
+            return []
+
+        hits = []
+        first = self.postings[tids[0]]
+        rest = tids[1:]
+        for i in range(0, len(first), 2):
+            doc_id, pos = first[i], first[i + 1]
+            doc = self.docs[doc_id]
+            if pos + len(words) > doc["length"]:
+                continue
+            at = doc["start"] + pos
+            if all(self.surface_term[self.tokens[at + k + 1]] == tid for k, tid in enumerate(rest)):
+                hits.append((doc_id, pos))
+        return hits
+
+    def count(self, query):
+        """Number of occurrences of a word or phrase."""
+        return len(self._phrase_hits(query))
+
+    def search(self, query):
+        """Titles of documents containing the word or phrase, most hits first."""
+        per_doc = {}
+        for doc_id, _ in self._phrase_hits(query):
+            per_doc[doc_id] = per_doc.get(doc_id, 0) + 1
+        ranked = sorted(per_doc.items(), key=lambda kv: kv[1], reverse=True)
+        return [{"title": self.docs[d]["title"], "key": self.docs[d]["key"], "hits": n} for d, n in ranked]
+
+    def kwic(self, query, width=7, limit=None):
+        """Keyword-in-context lines: `width` tokens either side of each hit."""
+        size = len(TOKEN_RE.findall(query))
+        lines = []
+        for doc_id, pos in self._phrase_hits(query)[:limit]:
+            doc = self.docs[doc_id]
+            start = doc["start"]
+            left = self.tokens[start + max(pos - width, 0):start + pos]
+            hit = self.tokens[start + pos:start + pos + size]
+            right = self.tokens[start + pos + size:start + min(pos + size + width, doc["length"])]
+            lines.append({
+                "Left": " ".join(self.surfaces[s] for s in left),
+                "Keyword": " ".join(self.surfaces[s] for s in hit),
+                "Right": " ".join(self.surfaces[s] for s in right),
+                "Title": doc["title"],
+                "Position": pos,
+            })
+        return lines
+
+    # --- 3. STORAGE ---
+    def save(self, folder):
+        """Write the index as meta.json + two flat uint32 arrays."""
+        os.makedirs(folder, exist_ok=True)
+        offsets = []
+        with open(os.path.join(folder, "postings.bin"), "wb") as f:
+            offset = 0
+            for postings in self.postings:
+                postings.tofile(f)
+                offsets.append([offset, len(postings)])
+                offset += len(postings)
+        with open(os.path.join(folder, "tokens.bin"), "wb") as f:
+            self.tokens.tofile(f)
+        with open(os.path.join(folder, "surface_term.bin"), "wb") as f:
+            self.surface_term.tofile(f)
+
+        meta = {"docs": self.docs, "surfaces": self.surfaces, "terms": self.terms, "offsets": offsets}
+        tmp = os.path.join(folder, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(folder, "meta.json"))
+
+    @classmethod
+    def load(cls, folder):
+        idx = cls()
+        with open(os.path.join(folder, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        idx.docs = meta["docs"]
+        idx.keys = {d["key"] for d in idx.docs if d["key"]}
+        idx.surfaces = meta["surfaces"]
+        idx.surface_ids = {s: i for i, s in enumerate(idx.surfaces)}
+        idx.terms = meta["terms"]
+        idx.term_ids = {t: i for i, t in enumerate(idx.terms)}
+
+        idx.tokens = _read_array(os.path.join(folder, "tokens.bin"))
+        idx.surface_term = _read_array(os.path.join(folder, "surface_term.bin"))
+        flat = _read_array(os.path.join(folder, "postings.bin"))
+        idx.postings = [flat[o:o + n] for o, n in meta["offsets"]]
+        return idx
+
+    @classmethod
+    def open(cls, folder):
+        """Load the index in `folder`, or start an empty one if there is none yet."""
+        if os.path.exists(os.path.join(folder, "meta.json")):
+            return cls.load(folder)
+        return cls()
+
+
+def _read_array(path):
+    data = array('I')
+    with open(path, "rb") as f:
+        data.frombytes(f.read())
+    return data
+
+
+# --- COMMAND LINE ---
+if __name__ == "__main__":
+    if len(sys.argv) < 4 or sys.argv[1] not in ("add", "kwic"):
+        print("Usage: python corpus_index.py add <index_dir> <corpus.csv> [...]")
+        print("       python corpus_index.py kwic <index_dir> \"search phrase\"")
+        sys.exit(1)
+
+    command, folder = sys.argv[1], sys.argv[2]
+    index = CorpusIndex.open(folder)
+
+    if command == "add":
+        for path in sys.argv[3:]:
+            added = index.add_csv(path)
+            print(f"✅ {path}: indexed {added} new documents")
+        index.save(folder)
+        print(f"💾 Saved {len(index.docs)} documents / {len(index.tokens):,} tokens to {folder}")
+    else:
+        query = " ".join(sys.argv[3:])
+        lines = index.kwic(query)
+        for line in lines:
+            print(f"{line['Left'][-60:]:>60}  [{line['Keyword']}]  {line['Right'][:60]}")
+        print(f"\n🔎 {len(lines)} hits for '{query}'")
@@ -0,0 +1,181 @@
+import io
+import re
+import sys
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+
+# --- CONFIGURATION ---
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+BODY_PART = "word/document.xml"
+# Extra parts read after the body, in this order (numbered parts sorted by number)
+EXTRA_PARTS = [
+    re.compile(r"word/header(\d*)\.xml$"),
+    re.compile(r"word/footnotes()\.xml$"),
+    re.compile(r"word/endnotes()\.xml$"),
+    re.compile(r"word/footer(\d*)\.xml$"),
+]
+CELL_SEP = "\t"
+
+
+def _part_lines(stream):
+    """Yield the text lines of one WordprocessingML part.
+
+    Paragraphs become lines; table rows become one line with cells joined by
+    CELL_SEP. Text inside mc:Fallback is skipped: it repeats the mc:Choice
+    content (e.g. a text box saved again as VML) for older readers. Finished
+    top-level blocks are cleared as we go, so memory stays bounded by the
+    largest single paragraph/table, not the document.
+    """
+    paragraphs = []   # Stack of open paragraphs (text boxes nest them)
+    cells = []        # Stack of open table cells (lists of paragraph texts)
+    rows = []         # Stack of open table rows (lists of cell texts)
+    depth = 0
+    fallback = 0      # >0 while inside an mc:Fallback subtree
+    container = None  # The <w:body>/<w:hdr>/... element whose children we clear
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if depth == 2 and tag == W + "body" or depth == 1 and tag != W + "document":
+                container = elem
+            if tag == MC_FALLBACK:
+                fallback += 1
+            if fallback:
+                continue
+            if tag == W + "p":
+                paragraphs.append([])
+            elif tag == W + "tc":
+                cells.append([])
+            elif tag == W + "tr":
+                rows.append([])
+            continue
+
+        depth -= 1
+        if fallback:
+            if tag == MC_FALLBACK:
+                fallback -= 1
+        elif tag == W + "t":
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == W + "tab":
+            if paragraphs:
+                paragraphs[-1].append("\t")
+        elif tag in (W + "br", W + "cr"):
+            if paragraphs:
+                paragraphs[-1].append("\n")
+        elif tag == W + "p":
+            text = "".join(paragraphs.pop())
+            if paragraphs:
+                paragraphs[-1].append("\n" + text + "\n")  # Text box inside a paragraph
+            elif cells:
+                cells[-1].append(text)
+            else:
+                yield text
+        elif tag == W + "tc":
+            cell = " ".join(t for t in cells.pop() if t)
+            if rows:
+                rows[-1].append(cell)
+        elif tag == W + "tr":
+            line = CELL_SEP.join(rows.pop())
+            if cells:
+                cells[-1].append(line)  # Nested table: keep it inside the outer cell
+            else:
+                yield line
+
+        if container is not None and elem is not container and len(container) and container[-1] is elem:
+            container.clear()
+
+
+def iter_docx_lines(file_bytes, include_extras=True):
+    """Stream the text lines of a .docx: body (paragraphs + tables), then headers,
+    footnotes, endnotes and footers."""
+    with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
+        names = zf.namelist()
+        parts = [BODY_PART] if BODY_PART in names else []
+        if include_extras:
+            for part_re in EXTRA_PARTS:
+                numbered = []
+                for name in names:
+                    match = part_re.match(name)
+                    if match:
+                        numbered.append((int(match.group(1) or 0), name))
+                parts += [name for _, name in sorted(numbered)]
+        for part in parts:
+            with zf.open(part) as stream:
+                yield from _part_lines(stream)
+
+
+def get_text_from_docx(file_bytes, include_extras=True):
+    """Streaming replacement for the python-docx extractor"""
+    try:
+        return "\n".join(iter_docx_lines(file_bytes, include_extras))
+    except Exception:
+        return ""
+
+
+# --- BENCHMARK ---
+def _legacy_docx_text(file_bytes):
+    """The previous Corpus_Scrubber extractor (python-docx object model)."""
+    from docx import Document
+    doc = Document(io.BytesIO(file_bytes))
+    return "\n".join(para.text for para in doc.paragraphs)
+
+
+def _sample_docx(paragraphs=20000, table_rows=500):
+    """Build a synthetic transcript .docx without needing python-docx."""
+    ns = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    line = "Interviewer: Can you tell me about kapwa in your community? Respondent: We help each other."
+    body = [f"<w:p><w:r><w:t>{i}. {line}</w:t></w:r></w:p>" for i in range(paragraphs)]
+    body.append("<w:tbl>" + "".join(
+        f"<w:tr><w:tc><w:p><w:r><w:t>Code {i}</w:t></w:r></w:p></w:tc>"
+        f"<w:tc><w:p><w:r><w:t>Theme {i % 7}</w:t></w:r></w:p></w:tc></w:tr>"
+        for i in range(table_rows)) + "</w:tbl>")
+    document = f'<?xml version="1.0" encoding="UTF-8"?><w:document {ns}><w:body>{"".join(body)}</w:body></w:document>'
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml",
+                    '<?xml version="1.0" encoding="UTF-8"?>'
+                    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                    '<Default Extension="xml" ContentType="application/xml"/>'
+                    '<Override PartName="/word/document.xml" '
+                    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                    '</Types>')
+        zf.writestr("_rels/.rels",
+                    '<?xml version="1.0" encoding="UTF-8"?>'
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" '
+                    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                    'Target="word/document.xml"/></Relationships>')
+        zf.writestr(BODY_PART, document)
+    return buffer.getvalue()
+
+
+def _timed(fn, data, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+if __name__ == "__main__":
+    # Usage: python docx_stream.py [file.docx ...]   (no args = synthetic transcript)
+    samples = [(p, open(p, "rb").read()) for p in sys.argv[1:]] or [("synthetic", _sample_docx())]
+
+    for name, data in samples:
+        fast, text = _timed(get_text_from_docx, data)
+        print(f"📄 {name}: {len(data) / 1e6:.1f} MB docx, {len(text.split()):,} words")
+        print(f"   ⚡ streaming:   {fast * 1000:8.1f} ms")
+        try:
+            slow, old_text = _timed(_legacy_docx_text, data)
+        except ImportError:
+            print("   (python-docx not installed, skipping comparison)")
+            continue
+        print(f"   🐢 python-docx: {slow * 1000:8.1f} ms  ({slow / fast:.1f}x slower, "
+              f"{len(old_text.split()):,} words - tables/headers/notes dropped)")
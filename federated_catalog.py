@@ -0,0 +1,216 @@
+import queue
+import re
+import threading
+import unicodedata
+
+import resources
+from author_profile import infer_country_code
+
+# --- CONFIGURATION ---
+S2_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+S2_FIELDS = "title,year,externalIds,authors.name,authors.affiliations,openAccessPdf,url,publicationTypes,venue"
+OPENALEX_URL = "https://api.openalex.org/works"
+TIMEOUT = 30
+
+# Columns every source is normalized to before the merge.
+# Country is always an ISO code; Affiliation is the raw institution name.
+COLUMNS = ["Title", "Year", "DOI", "First_Author", "Affiliation", "Country", "Type", "Link", "Sources"]
+
+
+# --- 1. NORMALIZATION ---
+def normalize_doi(doi):
+    """'https://doi.org/10.1/ABC' -> '10.1/abc'"""
+    if not doi:
+        return None
+    doi = doi.strip().lower()
+    doi = re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', doi)
+    return doi or None
+
+
+def normalize_title(title):
+    """Case, accent and punctuation-insensitive title key for papers without a DOI."""
+    if not title:
+        return None
+    title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
+    title = re.sub(r'[^a-z0-9]+', ' ', title.lower()).strip()
+    return title or None
+
+
+# --- 2. SOURCES (each yields normalized records) ---
+def semantic_scholar(query, year_from, year_to, limit):
+    params = {"query": query, "year": f"{year_from}-{year_to}", "fields": S2_FIELDS}
+    offset = 0
+    while offset < limit:
+        params["offset"] = offset
+        params["limit"] = min(100, limit - offset)
+        r = resources.http_get(S2_URL, params=params, timeout=TIMEOUT)
+        r.raise_for_status()  # 429s are routine on the keyless API; surface them in errors
+        r = r.json()
+        papers = r.get("data") or []
+        for p in papers[:limit - offset]:
+            first_author, affiliation = "Unknown", None
+            if p.get('authors'):
+                first_author = p['authors'][0].get('name') or "Unknown"
+                affs = p['authors'][0].get('affiliations') or []
+                affiliation = affs[0] if affs else None
+
+            link = None
+            if p.get('openAccessPdf'):
+                link = p['openAccessPdf'].get('url')
+            link = link or p.get('url')
+
+            yield {
+                "Title": p.get('title'),
+                "Year": p.get('year'),
+                "DOI": normalize_doi((p.get('externalIds') or {}).get('DOI')),
+                "First_Author": first_author,
+                "Affiliation": affiliation,
+                "Country": infer_country_code(affiliation),
+                "Type": ", ".join(p.get('publicationTypes') or []) or None,
+                "Link": link,
+            }
+        if len(papers) < params["limit"] or "next" not in r:
+            break
+        offset += len(papers)
+
+
+def openalex(query, year_from, year_to, limit):
+    params = {
+        "search": query,
+        "filter": f"from_publication_date:{year_from}-01-01,to_publication_date:{year_to}-12-31",
+        "per_page": min(limit, 200),
+        "sort": "relevance_score:desc",
+    }
+    page = 1
+    fetched = 0
+    while fetched < limit:
+        params["page"] = page
+        r = resources.http_get(OPENALEX_URL, params=params, timeout=TIMEOUT)
+        r.raise_for_status()
+        results = r.json().get('results', [])
+        for paper in results[:limit - fetched]:
+            first_author, affiliation, country = "Unknown", None, None
+            authorships = paper.get('authorships') or []
+            if authorships:
+                first_author = (authorships[0].get('author') or {}).get('display_name') or "Unknown"
+                insts = authorships[0].get('institutions') or []
+                if insts:
+                    affiliation = insts[0].get('display_name')
+                    country = insts[0].get('country_code')
+
+            yield {
+                "Title": paper.get('title'),
+                "Year": paper.get('publication_year'),
+                "DOI": normalize_doi(paper.get('doi')),
+                "First_Author": first_author,
+                "Affiliation": affiliation,
+                "Country": country,
+                "Type": paper.get('type'),
+                "Link": (paper.get('open_access') or {}).get('oa_url'),
+            }
+        fetched += len(results)
+        if len(results) < params["per_page"]:
+            break
+        page += 1
+
+
+SOURCES = {
+    "Semantic Scholar": semantic_scholar,
+    "OpenAlex": openalex,
+}
+PRIORITY = ["OpenAlex", "Semantic Scholar"]  # OpenAlex has structured country codes & types
+
+
+# --- 3. STREAMING MERGE ---
+class CatalogMerger:
+    """Hash-join on DOI with a normalized-title fallback, fed one record at a time.
+
+    Each merged row keeps the raw record from every source that contributed;
+    catalog() resolves the columns, preferring sources in PRIORITY order.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.by_doi = {}
+        self.by_title = {}
+
+    def add(self, source, record):
+        doi = record.get("DOI")
+        title_key = normalize_title(record.get("Title"))
+        if not doi and not title_key:
+            return None
+
+        row = (doi and self.by_doi.get(doi)) or (title_key and self.by_title.get(title_key))
+        # Two different DOIs sharing a title are different papers (e.g. preprint vs erratum)
+        if row is not None and doi and row["doi"] and row["doi"] != doi:
+            row = None
+
+        if row is None:
+            row = {"doi": doi, "records": {}}
+            self.rows.append(row)
+        row["records"].setdefault(source, record)
+        row["doi"] = row["doi"] or doi
+
+        if row["doi"]:
+            self.by_doi.setdefault(row["doi"], row)
+        if title_key:
+            self.by_title.setdefault(title_key, row)
+        return row
+
+    def catalog(self):
+        """One dict per paper: COLUMNS plus a <Source>_Link column per source."""
+        out = []
+        for row in self.rows:
+            records = row["records"]
+            ranked = [records[s] for s in PRIORITY if s in records]
+            merged = {}
+            for col in COLUMNS[:-1]:
+                merged[col] = next((r[col] for r in ranked if r.get(col) not in (None, "", "Unknown")), None)
+            merged["Sources"] = " + ".join(s for s in PRIORITY if s in records)
+            for source in PRIORITY:
+                merged[source.replace(" ", "_") + "_Link"] = records[source].get("Link") if source in records else None
+            out.append(merged)
+        return out
+
+
+def federated_search(query, year_from, year_to, limit, sources=None, on_record=None):
+    """Query every source concurrently and merge records as they stream in.
+
+    Each source runs in its own thread and pushes records onto a queue; the
+    caller's thread does the merge, so total time is that of the slowest
+    source. `on_record(source, merged_row, counts)` is called after each record.
+    Returns (catalog_rows, counts, errors).
+    """
+    sources = sources or list(SOURCES)
+    records = queue.Queue()
+    done = object()
+
+    def worker(name):
+        try:
+            for record in SOURCES[name](query, year_from, year_to, limit):
+                records.put((name, record))
+        except Exception as e:
+            records.put((name, e))
+        finally:
+            records.put((name, done))
+
+    for name in sources:
+        threading.Thread(target=worker, args=(name,), daemon=True, name=f"catalog-{name}").start()
+
+    merger = CatalogMerger()
+    counts = {name: 0 for name in sources}
+    errors = {}
+    running = len(sources)
+    while running:
+        name, item = records.get()
+        if item is done:
+            running -= 1
+        elif isinstance(item, Exception):
+            errors[name] = str(item)
+        else:
+            counts[name] += 1
+            row = merger.add(name, item)
+            if on_record and row is not None:
+                on_record(name, row, counts)
+
+    return merger.catalog(), counts, errors
@@ -0,0 +1,342 @@
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+import resources
+from corpus_builder import get_text_from_pdf_url, SEARCH_QUERY, START_YEAR, BATCH_SIZE, TARGET_WORDS, INDEX_DIR, STATS_FILE
+from corpus_index import CorpusIndex
+from token_stats import TokenStats
+
+# --- CONFIGURATION ---
+DB_FILE = "harvest_queue.db"
+S2_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+LEASE_SECONDS = 900   # How long a lease lasts before another worker may take the item;
+                      # renewed before full extraction, which covers a MAX_PAGES PDF at ~0.5 s/page
+MAX_ATTEMPTS = 3      # Then the item is marked failed
+IDLE_SLEEP = 2        # Seconds to wait when nothing is leasable yet
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE,          -- 'search:<offset>' or the PDF URL
+    kind TEXT,                -- 'search' | 'pdf'
+    payload TEXT,             -- JSON
+    status TEXT DEFAULT 'pending',
+    lease_token TEXT,
+    lease_until REAL,
+    attempts INTEGER DEFAULT 0,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (status, kind, id);
+CREATE TABLE IF NOT EXISTS docs (
+    source_url TEXT PRIMARY KEY,
+    year INTEGER,
+    title TEXT,
+    word_count INTEGER,
+    text TEXT,
+    worker TEXT,
+    stats TEXT                -- JSON TokenStats of this document, merged by export()
+);
+"""
+
+
+# --- 1. DATABASE ---
+# One host, N worker processes. WAL mode needs shared memory between the
+# processes, so the database must live on a local disk: don't point workers
+# on other machines at it over NFS/SMB, or the lease and exactly-once
+# guarantees no longer hold.
+def connect(db=DB_FILE):
+    conn = sqlite3.connect(db, timeout=60, isolation_level=None)  # We issue BEGIN ourselves
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    if "stats" not in {row[1] for row in conn.execute("PRAGMA table_info(docs)")}:
+        conn.execute("ALTER TABLE docs ADD COLUMN stats TEXT")  # Queue created before per-doc stats
+    return conn
+
+
+def _meta(conn, key, default=None):
+    row = conn.execute("SELECT v FROM meta WHERE k = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def _set_meta(conn, key, value):
+    conn.execute("INSERT OR REPLACE INTO meta (k, v) VALUES (?, ?)", (key, json.dumps(value)))
+
+
+def init_harvest(db, query, start_year, target_words, batch_size):
+    """Create the queue (or re-target an existing one) and seed the first search page."""
+    conn = connect(db)
+    conn.execute("BEGIN IMMEDIATE")
+    _set_meta(conn, "query", query)
+    _set_meta(conn, "start_year", start_year)
+    _set_meta(conn, "batch_size", batch_size)
+    _set_meta(conn, "target_words", target_words)
+    if _meta(conn, "total_words") is None:
+        _set_meta(conn, "total_words", 0)
+    conn.execute(
+        "INSERT OR IGNORE INTO items (key, kind, payload) VALUES (?, 'search', ?)",
+        ("search:0", json.dumps({"offset": 0})),
+    )
+    conn.execute("COMMIT")
+    conn.close()
+
+
+def target_reached(conn):
+    return _meta(conn, "total_words", 0) >= _meta(conn, "target_words", TARGET_WORDS)
+
+
+def lease(conn, worker):
+    """Atomically claim the next pending (or abandoned) item. Returns (id, kind, payload, token) or None.
+
+    Search pages go first so the PDF backlog keeps filling; once the word
+    target is reached nothing more is handed out.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if target_reached(conn):
+            conn.execute("COMMIT")
+            return None
+        # Give up on items that keep killing their workers
+        conn.execute(
+            "UPDATE items SET status = 'failed', reason = 'lease_expired' "
+            "WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+            (now, MAX_ATTEMPTS),
+        )
+        row = conn.execute(
+            "SELECT id, kind, payload FROM items "
+            "WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?) "
+            "ORDER BY kind = 'pdf', id LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        token = f"{worker}:{uuid.uuid4().hex[:8]}"
+        conn.execute(
+            "UPDATE items SET status = 'leased', lease_token = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+            (token, now + LEASE_SECONDS, row[0]),
+        )
+        conn.execute("COMMIT")
+        return row[0], row[1], json.loads(row[2]), token
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def renew(conn, item_id, token):
+    """Push our lease out another LEASE_SECONDS. Returns False if we no longer hold it."""
+    cur = conn.execute(
+        "UPDATE items SET lease_until = ? WHERE id = ? AND status = 'leased' AND lease_token = ?",
+        (time.time() + LEASE_SECONDS, item_id, token),
+    )
+    return cur.rowcount == 1
+
+
+def _finish(conn, item_id, token, status, reason=None):
+    """Close our lease. Returns False if the lease expired and someone else owns the item now."""
+    cur = conn.execute(
+        "UPDATE items SET status = ?, reason = ?, lease_until = NULL "
+        "WHERE id = ? AND status = 'leased' AND lease_token = ?",
+        (status, reason, item_id, token),
+    )
+    return cur.rowcount == 1
+
+
+def complete_search(conn, item_id, token, papers, next_offset):
+    """Queue the PDFs from one search page (and the next page) in one transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    if not _finish(conn, item_id, token, "done"):
+        conn.execute("ROLLBACK")
+        return 0
+    added = 0
+    for paper in papers:
+        pdf_info = paper.get('openAccessPdf')
+        if pdf_info and pdf_info.get('url'):
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO items (key, kind, payload) VALUES (?, 'pdf', ?)",
+                (pdf_info['url'], json.dumps({"url": pdf_info['url'], "title": paper.get('title'), "year": paper.get('year')})),
+            )
+            added += cur.rowcount
+    if next_offset is not None:
+        conn.execute(
+            "INSERT OR IGNORE INTO items (key, kind, payload) VALUES (?, 'search', ?)",
+            (f"search:{next_offset}", json.dumps({"offset": next_offset})),
+        )
+    conn.execute("COMMIT")
+    return added
+
+
+def complete_pdf(conn, item_id, token, worker, payload, text, reason):
+    """Record one PDF result. The document row, the global word total and the
+    item status change in a single transaction guarded by our lease token, so
+    each document is counted exactly once even if a lease expired and another
+    worker fetched the same URL. Token stats are counted here, before taking
+    the write lock, and stored with the document. Returns the words added (0 if none)."""
+    if text:
+        doc_stats = TokenStats()
+        doc_stats.add_text(text)
+    conn.execute("BEGIN IMMEDIATE")
+    if not _finish(conn, item_id, token, "done" if text else "skipped", reason):
+        conn.execute("ROLLBACK")
+        return 0
+    words = 0
+    if text and not target_reached(conn):
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO docs (source_url, year, title, word_count, text, worker, stats) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (payload['url'], payload.get('year'), payload.get('title'), doc_stats.words, text, worker,
+             json.dumps(doc_stats.to_dict())),
+        )
+        if cur.rowcount == 1:
+            words = doc_stats.words
+            _set_meta(conn, "total_words", _meta(conn, "total_words", 0) + words)
+    conn.execute("COMMIT")
+    return words
+
+
+def release(conn, item_id, token, reason):
+    """Hand an item back to the queue after a transient error."""
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute(
+        "UPDATE items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+        "reason = ?, lease_token = NULL, lease_until = NULL WHERE id = ? AND lease_token = ?",
+        (MAX_ATTEMPTS, reason, item_id, token),
+    )
+    conn.execute("COMMIT")
+
+
+# --- 2. WORKER ---
+def run_worker(db=DB_FILE, worker=None):
+    """Lease items until the target is reached or the queue is drained."""
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    conn = connect(db)
+    query = _meta(conn, "query", SEARCH_QUERY)
+    start_year = _meta(conn, "start_year", START_YEAR)
+    batch_size = _meta(conn, "batch_size", BATCH_SIZE)
+    print(f"👷 Worker {worker} started")
+
+    while True:
+        job = lease(conn, worker)
+        if job is None:
+            if target_reached(conn):
+                break
+            busy = conn.execute("SELECT COUNT(*) FROM items WHERE status IN ('pending', 'leased')").fetchone()[0]
+            if not busy:
+                break  # Queue drained
+            time.sleep(IDLE_SLEEP)
+            continue
+
+        item_id, kind, payload, token = job
+        try:
+            if kind == "search":
+                params = {
+                    "query": query,
+                    "year": f"{start_year}-2025",
+                    "limit": batch_size,
+                    "offset": payload['offset'],
+                    "openAccessPdf": "",  # Filter: Must have PDF
+                    "fields": "title,year,openAccessPdf"
+                }
+                r = resources.http_get(S2_SEARCH_URL, params=params, timeout=30)
+                r.raise_for_status()  # 429/5xx: released below and retried
+                r = r.json()
+                if "data" not in r:
+                    raise ValueError(f"Unexpected search response: {str(r)[:100]}")
+                papers = r['data']  # Only an empty page ends pagination
+                next_offset = payload['offset'] + batch_size if papers else None
+                added = complete_search(conn, item_id, token, papers, next_offset)
+                print(f"🔎 [{worker}] page @{payload['offset']}: queued {added} PDFs")
+                time.sleep(1)  # Be nice to the API
+            else:
+                # Download + probe may use part of the lease; renew it before the long extraction
+                text, reason = get_text_from_pdf_url(payload['url'], keep_going=lambda: renew(conn, item_id, token))
+                if text is not None and len(text) <= 1000:
+                    text, reason = None, "too_short"
+                words = complete_pdf(conn, item_id, token, worker, payload, text, reason)
+                if words:
+                    total = _meta(conn, "total_words", 0)
+                    print(f"📄 [{worker}] +{words:,} words (total {total:,}) {str(payload.get('title'))[:50]}")
+        except Exception as e:
+            print(f"Error: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            release(conn, item_id, token, str(e)[:200])
+
+    conn.close()
+    print(f"✅ Worker {worker} finished")
+
+
+# --- 3. REPORTING ---
+def status(db=DB_FILE):
+    conn = connect(db)
+    total = _meta(conn, "total_words", 0)
+    target = _meta(conn, "target_words", TARGET_WORDS)
+    print(f"📊 {total:,} / {target:,} words ({total / target:.1%})")
+    for kind, state, n in conn.execute("SELECT kind, status, COUNT(*) FROM items GROUP BY kind, status ORDER BY kind, status"):
+        print(f"   {kind:<7}{state:<9}{n:>8,}")
+    for reason, n in conn.execute(
+            "SELECT reason, COUNT(*) FROM items WHERE status = 'skipped' GROUP BY reason ORDER BY 2 DESC"):
+        print(f"   🚫 {reason}: {n:,}")
+    conn.close()
+
+
+def export(db=DB_FILE, filename="million_word_corpus.csv", index_dir=INDEX_DIR, stats_file=STATS_FILE):
+    """Write the accepted documents in corpus_builder's CSV layout, plus the
+    same token stats and KWIC index corpus_builder produces. Stats are merged
+    from the per-document counts the workers stored; the index is rebuilt."""
+    import pandas as pd
+    conn = connect(db)
+    df = pd.read_sql_query("SELECT year, title, word_count, text, source_url FROM docs ORDER BY rowid", conn)
+    df.to_csv(filename, index=False)
+    print(f"💾 Saved {len(df)} papers / {df['word_count'].sum():,} words to {filename}")
+
+    stats = TokenStats()
+    index = CorpusIndex()  # Fresh, so it holds exactly the docs in the CSV
+    for title, text, source_url, doc_stats in conn.execute(
+            "SELECT title, text, source_url, stats FROM docs ORDER BY rowid"):
+        if doc_stats:
+            stats.merge(TokenStats.from_dict(json.loads(doc_stats)))
+        else:
+            stats.add_text(text)  # Stored before workers kept per-doc stats
+        index.add_document(text, title=title or "", key=source_url)
+    conn.close()
+    stats.save(stats_file)
+    index.save(index_dir)
+    print(f"📊 Stats saved to {stats_file}: {stats.summary()}")
+    print(f"🗂️ Index saved to {index_dir} (query with: python corpus_index.py kwic {index_dir} \"word\")")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-process million-word harvest over a local SQLite queue (one host).")
+    parser.add_argument("command", choices=["init", "work", "status", "export"])
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--query", default=SEARCH_QUERY)
+    parser.add_argument("--start-year", type=int, default=START_YEAR)
+    parser.add_argument("--target", type=int, default=TARGET_WORDS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes to start on this machine")
+    parser.add_argument("--out", default="million_word_corpus.csv")
+    args = parser.parse_args()
+
+    if args.command == "init":
+        init_harvest(args.db, args.query, args.start_year, args.target, args.batch_size)
+        print(f"🚀 Queue ready in {args.db}. Start workers with: python harvest_queue.py work --db {args.db}")
+    elif args.command == "work":
+        procs = [multiprocessing.Process(target=run_worker, args=(args.db,)) for _ in range(args.workers)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        status(args.db)
+    elif args.command == "status":
+        status(args.db)
+    else:
+        export(args.db, args.out)
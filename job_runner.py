@@ -0,0 +1,157 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# --- CONFIGURATION ---
+MAX_WORKERS = 4  # How many harvests may run at the same time
+FINISHED_TTL = 3600  # Seconds a finished job (and its results) is kept around
+MAX_FINISHED = 20    # Finished jobs kept at most, oldest evicted first
+FINISHED_STATES = ("done", "failed", "cancelled")
+
+# Streamlit re-executes the app script on every rerun, but imported modules stay
+# in sys.modules. Keeping the pool and the job table here means running jobs
+# outlive widget clicks and browser refreshes.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="job")
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when the user asked it to stop."""
+
+
+class Job:
+    """Progress, partial results and cancellation flag for one background job."""
+
+    def __init__(self, name, owner=None):
+        self.id = uuid.uuid4().hex[:8]
+        self.name = name
+        self.owner = owner
+        self.status = "queued"  # queued / running / done / failed / cancelled
+        self.progress = 0.0
+        self.message = ""
+        self.error = None
+        self.created = time.time()
+        self.ended = None
+        self.stats = {}
+        self._results = []
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+
+    # --- Called from the worker thread ---
+    def update(self, progress=None, message=None, **stats):
+        with self._lock:
+            if progress is not None:
+                self.progress = min(max(progress, 0.0), 1.0)
+            if message is not None:
+                self.message = message
+            self.stats.update(stats)
+
+    def add_result(self, item):
+        with self._lock:
+            self._results.append(item)
+
+    def check_cancelled(self):
+        """Call between units of work; aborts the job if cancel() was requested."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    # --- Called from the UI thread ---
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def results(self):
+        """Copy of the results collected so far (safe while the job is running)."""
+        with self._lock:
+            return list(self._results)
+
+    def latest_results(self, n=5):
+        """The last n results, without copying the whole list."""
+        with self._lock:
+            return self._results[-n:]
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "id": self.id,
+                "name": self.name,
+                "status": self.status,
+                "progress": self.progress,
+                "message": self.message,
+                "error": self.error,
+                "stats": dict(self.stats),
+                "results": len(self._results),
+            }
+
+
+def _finish(job, status, error=None):
+    # One locked write, so snapshot() never sees a final status without its error/end time
+    with job._lock:
+        job.error = error
+        job.ended = time.time()
+        job.status = status
+
+
+def _run(job, fn, args, kwargs):
+    try:
+        if job.cancel_requested:
+            raise JobCancelled()
+        with job._lock:
+            job.status = "running"
+        fn(job, *args, **kwargs)
+        _finish(job, "done")
+    except JobCancelled:
+        _finish(job, "cancelled")
+    except Exception as e:
+        _finish(job, "failed", str(e))
+
+
+def _evict():
+    """Drop finished jobs past FINISHED_TTL, and the oldest beyond MAX_FINISHED."""
+    now = time.time()
+    with _jobs_lock:
+        finished = sorted((j for j in _jobs.values() if j.finished and j.ended), key=lambda j: j.ended, reverse=True)
+        for i, job in enumerate(finished):
+            if i >= MAX_FINISHED or now - job.ended > FINISHED_TTL:
+                del _jobs[job.id]
+
+
+def submit(name, fn, *args, owner=None, **kwargs):
+    """Queue fn(job, *args, **kwargs) on the worker pool and return its Job."""
+    _evict()
+    job = Job(name, owner)
+    with _jobs_lock:
+        _jobs[job.id] = job
+    _executor.submit(_run, job, fn, args, kwargs)
+    return job
+
+
+def get_job(job_id):
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def list_jobs(owner=None):
+    """Known jobs (only `owner`'s if given), newest first."""
+    _evict()
+    with _jobs_lock:
+        jobs = [j for j in _jobs.values() if owner is None or j.owner == owner]
+    return sorted(jobs, key=lambda j: j.created, reverse=True)
+
+
+def forget(job_id):
+    """Drop a finished job from the table (running jobs are cancelled first)."""
+    with _jobs_lock:
+        job = _jobs.pop(job_id, None)
+    if job and not job.finished:
+        job.cancel()
+    return job
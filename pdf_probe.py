@@ -0,0 +1,105 @@
+import re
+
+# --- CONFIGURATION ---
+SAMPLE_PAGES = 3            # Pages read by the probe (first, middle, last)
+MIN_TEXT_CHARS = 1000       # Same cut-off the harvesters apply after extraction
+MIN_CHARS_PER_PAGE = 300    # Below this: scanned images or slide decks
+MAX_PAGES = 1500            # Above this: books/proceedings dumps, not papers
+LANGUAGES = ("en", "tl")    # Languages we keep; None to accept anything
+MIN_WORDS_FOR_LANGUAGE = 80 # Don't judge language on tiny samples
+MIN_LANGUAGE_SCORE = 0.08   # Share of words that must be the winner's stopwords
+MIN_LANGUAGE_MARGIN = 2.0   # Winner must score this many times the runner-up
+
+# Disjoint lists: a word in two languages would give both of them the vote.
+# Non-kept languages are listed so we can confidently recognise them; text
+# that matches none of these is recorded as 'other' but never rejected.
+STOPWORDS = {
+    "en": {"the", "and", "of", "to", "is", "that", "for", "with", "as", "are", "this", "on", "by", "be",
+           "was", "were", "which", "from", "have", "it", "or", "not", "their", "they", "has", "an"},
+    "tl": {"ang", "ng", "sa", "mga", "ay", "hindi", "ito", "kung", "siya", "nila", "din", "rin",
+           "naman", "lamang", "kanilang", "ating", "nang", "kaniyang", "dahil", "ngunit", "pag", "ko"},
+    "es": {"el", "los", "las", "del", "y", "que", "por", "con", "una", "es", "su", "para", "como",
+           "al", "lo", "pero", "sus", "entre", "sobre"},
+    "fr": {"le", "les", "des", "et", "est", "une", "du", "dans", "qui", "pour", "pas", "au", "sur",
+           "avec", "ce", "sont", "aux", "ou"},
+    "de": {"der", "die", "das", "und", "ist", "nicht", "mit", "sich", "den", "dem", "ein", "eine",
+           "auf", "auch", "werden", "wird", "zu", "von"},
+}
+WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+def _sample_indexes(page_count, sample=SAMPLE_PAGES):
+    if page_count <= sample:
+        return list(range(page_count))
+    step = (page_count - 1) / (sample - 1)
+    return sorted({round(i * step) for i in range(sample)})
+
+
+def guess_language(text):
+    """Stopword vote: returns 'en', 'tl', ... when one language clearly wins,
+    'mixed' when two are close (e.g. Taglish), 'other' when none match."""
+    words = [w.lower() for w in WORD_RE.findall(text)]
+    if len(words) < MIN_WORDS_FOR_LANGUAGE:
+        return "unknown"
+    scores = {lang: sum(w in stops for w in words) / len(words) for lang, stops in STOPWORDS.items()}
+    best, runner_up = sorted(scores, key=scores.get, reverse=True)[:2]
+    if scores[best] < MIN_LANGUAGE_SCORE:
+        return "other"
+    if scores[best] < MIN_LANGUAGE_MARGIN * scores[runner_up]:
+        return "mixed"
+    return best
+
+
+def probe_pages(page_count, get_page_text):
+    """Decide from a few sample pages whether a PDF is worth fully extracting.
+
+    `get_page_text(i)` returns the text of page i. Returns a dict with
+    'ok', a 'reason' ('ok' or why it was rejected) and the measured figures.
+    """
+    result = {"ok": False, "reason": "ok", "pages": page_count, "chars_per_page": 0, "language": "unknown"}
+
+    if page_count == 0:
+        result["reason"] = "empty"
+        return result
+    if page_count > MAX_PAGES:
+        result["reason"] = "too_many_pages"
+        return result
+
+    indexes = _sample_indexes(page_count)
+    sample = ""
+    errors = 0
+    for i in indexes:
+        try:
+            sample += (get_page_text(i) or "") + "\n"
+        except Exception:
+            errors += 1
+
+    chars = len(sample.strip())
+    result["chars_per_page"] = chars // max(len(indexes) - errors, 1)  # Over pages that parsed
+    result["language"] = guess_language(sample)
+
+    if chars == 0 and errors:
+        result["reason"] = "extract_error"  # Pages failed to parse, not necessarily a scan
+    elif chars == 0:
+        result["reason"] = "no_text_layer"  # Image-only scan
+    elif result["chars_per_page"] * page_count < MIN_TEXT_CHARS:
+        result["reason"] = "too_short"
+    elif result["chars_per_page"] < MIN_CHARS_PER_PAGE:
+        result["reason"] = "low_text_density"  # Slides, posters, figure dumps
+    # Only a confident match to a language we don't keep rejects; 'other',
+    # 'mixed' and 'unknown' are recorded but let through
+    elif LANGUAGES and result["language"] in STOPWORDS and result["language"] not in LANGUAGES:
+        result["reason"] = f"language:{result['language']}"
+    else:
+        result["ok"] = True
+    return result
+
+
+def probe_fitz(doc):
+    """Probe an open PyMuPDF document."""
+    return probe_pages(doc.page_count, lambda i: doc[i].get_text())
+
+
+def probe_pypdf(reader):
+    """Probe a PyPDF2.PdfReader."""
+    return probe_pages(len(reader.pages), lambda i: reader.pages[i].extract_text())
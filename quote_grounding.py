@@ -0,0 +1,160 @@
+import re
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+# --- CONFIGURATION ---
+MIN_QUOTE_CHARS = 8  # Normalized length below which a "quote" is too short to ground
+MIN_FRAGMENT_WORDS = 3  # Each part of an elided quote needs this many words
+MAX_FRAGMENT_GAP = 300  # Normalized chars allowed between consecutive parts of an elided quote
+QUOTE_MARKS = "\"'“”‘’«»` "
+ELLIPSIS_RE = re.compile(r"\.\s*\.\s*\.|…|\[\.\.\.\]")  # Model-elided passages
+WORD_RE = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Keep only letters/digits, casefolded, plus a map back to original offsets.
+
+    Dropping whitespace, punctuation and hyphens makes line wraps, double
+    spaces and "respon- sibility" style PDF hyphenation irrelevant to matching.
+    """
+    chars = []
+    offsets = array('I')
+    for i, ch in enumerate(text):
+        if ch.isalnum():
+            for folded in ch.casefold():
+                chars.append(folded)
+                offsets.append(i)
+    return "".join(chars), offsets
+
+
+class QuoteMatcher:
+    """Aho-Corasick automaton over every normalized quote.
+
+    One left-to-right pass over the document finds all quotes at once, so
+    the cost is linear in document size plus total quote length, however
+    many quotes the model returned.
+    """
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        self.lengths = []
+        for pid, pattern in enumerate(patterns):
+            self._insert(pid, pattern)
+        self._build_links()
+
+    def _insert(self, pid, pattern):
+        state = 0
+        for ch in pattern:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        self.out[state].append(pid)
+        self.lengths.append(len(pattern))
+
+    def _build_links(self):
+        todo = deque(self.goto[0].values())
+        while todo:
+            state = todo.popleft()
+            for ch, nxt in self.goto[state].items():
+                todo.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                link = self.goto[f].get(ch, 0)
+                self.fail[nxt] = link if link != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def all_matches(self, text):
+        """{pattern id: sorted list of start offsets} of every occurrence of each pattern."""
+        found = {}
+        goto, fail, out, lengths = self.goto, self.fail, self.out, self.lengths
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                found.setdefault(pid, []).append(pos - lengths[pid] + 1)
+        return found
+
+
+def _tightest_chain(fragments, found, lengths):
+    """(start, end) in normalized offsets of the shortest run of `fragments`, or None.
+
+    Each fragment must start after, and end no earlier than, the one before
+    it, at most MAX_FRAGMENT_GAP characters later (fragments may overlap, e.g.
+    when the '...' elided nothing). For every occurrence of the last fragment
+    we walk back taking the latest fitting occurrence of each earlier one.
+    """
+    best = None
+    last = fragments[-1]
+    for last_start in found.get(last, []):
+        end = last_start + lengths[last]
+        nxt_start, nxt_end = last_start, end
+        for pid in reversed(fragments[:-1]):
+            starts = found.get(pid, [])
+            i = bisect_right(starts, min(nxt_start - 1, nxt_end - lengths[pid])) - 1
+            if i < 0 or nxt_start - (starts[i] + lengths[pid]) > MAX_FRAGMENT_GAP:
+                break
+            nxt_start, nxt_end = starts[i], starts[i] + lengths[pid]
+        else:
+            if best is None or end - nxt_start < best[1] - best[0]:
+                best = (nxt_start, end)
+    return best
+
+
+def ground_quotes(source_text, quotes):
+    """Locate each quote in the source text.
+
+    Quotes with an ellipsis are split into fragments that must all be found,
+    in order and close together; the tightest such chain is reported (the
+    earliest one if several tie). Returns one dict per quote: 'status'
+    ('found', 'not_found' or 'unverifiable' when the quote, or any fragment
+    of it, is too short to check), 'found' (bool), and 'start'/'end'
+    character offsets into the original source_text (None unless found).
+    """
+    norm_text, offsets = normalize(source_text or "")
+
+    patterns = []
+    pattern_ids = {}  # normalized fragment -> pattern id (duplicates share one)
+    quote_fragments = []
+    for quote in quotes:
+        parts = [p for p in ELLIPSIS_RE.split(str(quote or "").strip(QUOTE_MARKS)) if normalize(p)[0]]
+        fragments = []
+        for part in parts:
+            norm_part, _ = normalize(part)
+            # Too short to check (two common words joined by '...' match almost anywhere),
+            # so the quote can't be verified
+            if len(norm_part) < MIN_QUOTE_CHARS or (len(parts) > 1 and len(WORD_RE.findall(part)) < MIN_FRAGMENT_WORDS):
+                fragments = None
+                break
+            if norm_part not in pattern_ids:
+                pattern_ids[norm_part] = len(patterns)
+                patterns.append(norm_part)
+            fragments.append(pattern_ids[norm_part])
+        quote_fragments.append(fragments or None)
+
+    found = QuoteMatcher(patterns).all_matches(norm_text) if patterns else {}
+    lengths = [len(p) for p in patterns]
+
+    results = []
+    for fragments in quote_fragments:
+        if fragments is None:
+            results.append({"status": "unverifiable", "found": False, "start": None, "end": None})
+            continue
+
+        chain = _tightest_chain(fragments, found, lengths)
+        if chain is None:
+            results.append({"status": "not_found", "found": False, "start": None, "end": None})
+        else:
+            start, end = chain
+            results.append({"status": "found", "found": True, "start": offsets[start], "end": offsets[end - 1] + 1})
+    return results
@@ -0,0 +1,143 @@
+import functools
+import importlib
+import os
+import queue
+import threading
+import time
+
+# --- CONFIGURATION ---
+MODEL_FILE = "latest-model.txt"
+FALLBACK_MODEL = "gemini-2.5-flash"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+
+# Heavy modules loaded on first use: `resources.fitz`, `resources.PyPDF2`,
+# `resources.pandas` (for apps that only build a DataFrame after a button press).
+# genai is only imported by gemini_model(), i.e. when an analysis actually runs.
+LAZY_MODULES = {
+    "fitz": "fitz",
+    "PyPDF2": "PyPDF2",
+    "pandas": "pandas",
+}
+
+# Streamlit re-runs the app script on every interaction, but this module is
+# imported once per process. Anything built here is reused by every rerun and
+# every session.
+_lock = threading.RLock()
+_sessions = queue.LifoQueue()  # Idle keep-alive sessions, shared by all threads
+
+
+def __getattr__(name):
+    if name in LAZY_MODULES:
+        return importlib.import_module(LAZY_MODULES[name])
+    raise AttributeError(f"module 'resources' has no attribute '{name}'")
+
+
+def singleton(fn):
+    """Build the value once per process (thread-safe), then hand back the same object."""
+    cache = {}
+
+    @functools.wraps(fn)
+    def wrapper(*args):
+        if args not in cache:
+            with _lock:
+                if args not in cache:
+                    cache[args] = fn(*args)
+        return cache[args]
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# --- Shared objects ---
+@singleton
+def gender_detector():
+    """gender_guesser's Detector loads its whole name dictionary; do it once."""
+    import gender_guesser.detector as gender
+    return gender.Detector()
+
+
+@singleton
+def gemini_model(model_name, api_key):
+    """One GenerativeModel per model name and key; imports and configures genai on first use."""
+    genai = importlib.import_module("google.generativeai")
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+_model_file_cache = {}
+
+
+def model_name(path=MODEL_FILE):
+    """Contents of latest-model.txt, re-read only when get_best_model.py rewrites it."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return FALLBACK_MODEL
+    cached = _model_file_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, "r") as f:
+            name = f.read().strip() or FALLBACK_MODEL
+    except OSError:
+        return FALLBACK_MODEL
+    _model_file_cache[path] = (mtime, name)
+    return name
+
+
+def _checkout_session():
+    try:
+        return _sessions.get_nowait()
+    except queue.Empty:
+        import requests
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        return session
+
+
+def http_get(url, **kwargs):
+    """requests.get through a pooled keep-alive Session.
+
+    Sessions aren't thread-safe, so each call checks one out of a process-wide
+    pool and hands it back afterwards. Streamlit runs every rerun on a fresh
+    thread, so the pool (not the thread) is what keeps connections warm.
+    """
+    session = _checkout_session()
+    try:
+        return session.get(url, **kwargs)
+    finally:
+        _sessions.put(session)
+
+
+# --- BENCHMARK ---
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    # Cold = first call in a fresh process (import + build), warm = what every later rerun pays
+    checks = {
+        "gender_guesser Detector": gender_detector,
+        "latest-model.txt": model_name,
+        "requests Session": lambda: _sessions.put(_checkout_session()),
+        "import fitz": lambda: __getattr__("fitz"),
+        "import PyPDF2": lambda: __getattr__("PyPDF2"),
+        "import pandas": lambda: __getattr__("pandas"),
+        "import genai": lambda: importlib.import_module("google.generativeai"),
+    }
+
+    print(f"{'Resource':<26}{'cold (ms)':>12}{'warm (ms)':>12}")
+    cold_total = warm_total = 0.0
+    for label, fn in checks.items():
+        try:
+            cold = _time(fn)
+            warm = min(_time(fn) for _ in range(5))
+        except ImportError as e:
+            print(f"{label:<26}{'(not installed: ' + e.name + ')':>24}")
+            continue
+        cold_total += cold
+        warm_total += warm
+        print(f"{label:<26}{cold:>12.2f}{warm:>12.4f}")
+    print(f"{'TOTAL per rerun':<26}{cold_total:>12.2f}{warm_total:>12.4f}")
@@ -0,0 +1,123 @@
+import json
+import re
+from collections import Counter
+
+# --- CONFIGURATION ---
+NGRAM_SIZES = (2, 3)  # Bigrams & trigrams
+WORD_RE = re.compile(r"\S+")  # Same units as len(text.split())
+STRIP_CHARS = "\"'“”‘’.,;:!?()[]{}<>«»…-–—*_/\\|"
+
+
+class TokenStats:
+    """Word, type/token, frequency and n-gram counts built in one streaming pass.
+
+    `words` counts whitespace-delimited units exactly like len(text.split()),
+    so it can replace the old Word_Count. Frequencies and n-grams use the
+    lowercased word with surrounding punctuation stripped. Stats from different
+    documents or workers combine with merge() (or +).
+    """
+
+    def __init__(self, ngram_sizes=NGRAM_SIZES):
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.docs = 0
+        self.words = 0
+        self.tokens = 0
+        self.freq = Counter()
+        self.ngrams = {n: Counter() for n in self.ngram_sizes}
+
+    def add_text(self, text):
+        """Stream one document into the counters and return its word count."""
+        words = 0
+        tokens = 0
+        window = []
+        widest = max(self.ngram_sizes, default=0)
+        freq = self.freq
+        ngrams = self.ngrams
+
+        for match in WORD_RE.finditer(text or ""):
+            words += 1
+            token = match.group().strip(STRIP_CHARS).lower()
+            if not token:
+                continue
+            tokens += 1
+            freq[token] += 1
+
+            if widest:
+                window.append(token)
+                if len(window) > widest:
+                    del window[0]
+                for n in self.ngram_sizes:
+                    if len(window) >= n:
+                        ngrams[n][" ".join(window[-n:])] += 1
+
+        self.docs += 1
+        self.words += words
+        self.tokens += tokens
+        return words
+
+    # --- Corpus-level figures ---
+    @property
+    def types(self):
+        return len(self.freq)
+
+    @property
+    def type_token_ratio(self):
+        return self.types / self.tokens if self.tokens else 0.0
+
+    def top_words(self, n=20):
+        return self.freq.most_common(n)
+
+    def top_ngrams(self, size=2, n=20):
+        return self.ngrams[size].most_common(n)
+
+    def summary(self):
+        return {
+            "Documents": self.docs,
+            "Words": self.words,
+            "Tokens": self.tokens,
+            "Types": self.types,
+            "Type_Token_Ratio": round(self.type_token_ratio, 4),
+        }
+
+    # --- Combining & saving ---
+    def merge(self, other):
+        """Add another TokenStats (e.g. from a parallel worker) into this one."""
+        self.docs += other.docs
+        self.words += other.words
+        self.tokens += other.tokens
+        self.freq.update(other.freq)
+        for n, counts in other.ngrams.items():
+            self.ngrams.setdefault(n, Counter()).update(counts)
+        self.ngram_sizes = tuple(sorted(self.ngrams))
+        return self
+
+    def __add__(self, other):
+        return TokenStats(self.ngram_sizes).merge(self).merge(other)
+
+    def to_dict(self):
+        return {
+            "docs": self.docs,
+            "words": self.words,
+            "tokens": self.tokens,
+            "freq": dict(self.freq),
+            "ngrams": {str(n): dict(c) for n, c in self.ngrams.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(int(n) for n in data.get("ngrams", {}))
+        stats.docs = data["docs"]
+        stats.words = data["words"]
+        stats.tokens = data["tokens"]
+        stats.freq = Counter(data["freq"])
+        stats.ngrams = {int(n): Counter(c) for n, c in data.get("ngrams", {}).items()}
+        return stats
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))